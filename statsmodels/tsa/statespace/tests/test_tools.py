@@ -10,6 +10,7 @@ import numpy as np
 from numpy.testing import (assert_allclose, assert_equal, assert_array_less,
                            assert_array_equal, assert_almost_equal)
 import pandas as pd
+from pandas.testing import assert_frame_equal, assert_series_equal
 from scipy.linalg import solve_discrete_lyapunov
 
 from statsmodels.tsa.statespace import tools
@@ -30,6 +31,12 @@ class TestCompanionMatrix:
                    [3, 4, 7, 8],
                    [1, 0, 0, 0],
                    [0, 1, 0, 0]]).T),
+        ([2 * np.eye(2), -np.array([[2, 4], [6, 8]]),
+          -np.array([[10, 12], [14, 16]])],
+         np.array([[1, 2, 5, 6],
+                   [3, 4, 7, 8],
+                   [1, 0, 0, 0],
+                   [0, 1, 0, 0]]).T),
         # GH 5570
         (np.int64(2), np.array([[0, 1], [0, 0]]))
     ]
@@ -38,6 +45,21 @@ class TestCompanionMatrix:
         for polynomial, result in self.cases:
             assert_equal(tools.companion_matrix(polynomial), result)
 
+    def test_dtype(self):
+        assert_equal(tools.companion_matrix(2).dtype, np.float64)
+
+        # Integer polynomials should not be truncated
+        matrix = tools.companion_matrix([2, 1])
+        assert_equal(matrix.dtype, np.float64)
+        assert_equal(matrix, [[-0.5]])
+
+        for dtype in [np.float32, np.float64, np.complex64, np.complex128]:
+            polynomial = np.array([1, -0.5, 0.25], dtype=dtype)
+            assert_equal(tools.companion_matrix(polynomial).dtype, dtype)
+
+            polynomial = [1, np.array([[0.5, 0], [0, 0.1]], dtype=dtype)]
+            assert_equal(tools.companion_matrix(polynomial).dtype, dtype)
+
 
 class TestDiff:
 
@@ -84,6 +106,43 @@ class TestDiff:
             x = tools.diff(series, diff, seasonal_diff, seasonal_periods)
             assert_almost_equal(x, result)
 
+    def test_pandas(self):
+        # Index, name, and columns should match repeated pandas differencing
+        ix = pd.period_range(start='2000-01', periods=20, freq='M')
+        series = pd.Series(np.arange(20)**3, index=ix, name='y')
+        desired = series.diff(4)[4:].diff()[1:]
+        actual = tools.diff(series, 1, 1, 4)
+        assert_series_equal(actual, desired)
+
+        frame = pd.DataFrame({'a': series, 'b': -series})
+        desired = frame.diff(4)[4:].diff()[1:]
+        actual = tools.diff(frame, 1, 1, 4)
+        assert_frame_equal(actual, desired)
+
+    def test_pandas_dtypes(self):
+        # Boolean and nullable dtypes should be differenced as by pandas
+        series = pd.Series([True, False, False, True, True, False], name='y')
+        desired = series.diff(2)[2:].diff()[1:]
+        actual = tools.diff(series, 1, 1, 2)
+        assert_series_equal(actual, desired)
+        assert_equal(actual.dtype, object)
+
+        series = pd.Series([1, 4, 9, 16, 25, 36], dtype='Int64', name='y')
+        desired = series.diff(2)[2:].diff()[1:]
+        actual = tools.diff(series, 1, 1, 2)
+        assert_series_equal(actual, desired)
+        assert_equal(actual.dtype, pd.Int64Dtype())
+
+        frame = pd.DataFrame({'a': series, 'b': series.astype(np.int64)})
+        desired = frame.diff(2)[2:].diff()[1:]
+        actual = tools.diff(frame, 1, 1, 2)
+        assert_frame_equal(actual, desired)
+
+    def test_bool(self):
+        # Boolean arrays should difference as in np.diff
+        series = np.array([True, False, False, True, True])
+        assert_equal(tools.diff(series), np.diff(series))
+
 
 class TestSolveDiscreteLyapunov:
 
@@ -151,6 +210,40 @@ class TestSolveDiscreteLyapunov:
         desired = self.solve_dicrete_lyapunov_direct(a, q, complex_step=True)
         assert_allclose(actual, desired)
 
+    def test_doubling(self):
+        # Stable case
+        a = tools.companion_matrix([1, -0.4, 0.5, -0.2]).T
+        q = np.diag([10., 0, 0])
+        actual = tools._solve_discrete_lyapunov_doubling(a, q)
+        desired = solve_discrete_lyapunov(a, q)
+        assert_allclose(actual, desired)
+
+        # Complex case
+        a = np.array([[0.5 + 0.2j, 0.1], [0, 0.3j]])
+        q = np.eye(2)
+        actual = tools._solve_discrete_lyapunov_doubling(a, q)
+        desired = solve_discrete_lyapunov(a, q)
+        assert_allclose(actual, desired)
+
+        # Non-stable case does not converge
+        a = np.array([[1.5]])
+        assert tools._solve_discrete_lyapunov_doubling(a, q[:1, :1]) is None
+
+    def test_direct(self):
+        # Real case
+        a = tools.companion_matrix([1, -0.4, 0.5, -0.2]).T
+        q = np.diag([10., 0, 0])
+        actual = tools._solve_discrete_lyapunov_direct(a, q)
+        desired = solve_discrete_lyapunov(a, q)
+        assert_allclose(actual, desired)
+
+        # Complex case
+        a = np.array([[0.5 + 0.2j, 0.1], [0, 0.3j]])
+        q = np.eye(2)
+        actual = tools._solve_discrete_lyapunov_direct(a, q)
+        desired = solve_discrete_lyapunov(a, q)
+        assert_allclose(actual, desired)
+
 
 class TestConcat:
 
@@ -199,6 +292,45 @@ class TestIsInvertible:
         for polynomial, invertible in self.cases:
             assert_equal(tools.is_invertible(polynomial), invertible)
 
+    def test_low_order(self):
+        # Test the closed-form roots used for first- and second-degree
+        # polynomials against the companion matrix eigenvalues
+        np.random.seed(1234)
+        for i in range(100):
+            polynomial = np.r_[1, np.random.uniform(-2, 2, size=i % 2 + 1)]
+            eigvals = np.linalg.eigvals(tools.companion_matrix(polynomial))
+            desired = np.all(np.abs(eigvals) < 1 - 1e-10)
+            assert_equal(tools.is_invertible(polynomial), desired)
+            assert_equal(tools.is_invertible(list(polynomial)), desired)
+
+        # Non-finite coefficients raise, as for higher orders
+        for polynomial in [[1, np.nan], [1, 0.5, np.nan], [1, np.inf, 0.1],
+                           [1, 0.5, np.nan, 0.1]]:
+            with pytest.raises(np.linalg.LinAlgError):
+                tools.is_invertible(polynomial)
+
+    def test_bounds(self):
+        # Test cases that are decided by the bounds on the eigenvalue moduli
+        # (or that fall through to the eigenvalue computation) against the
+        # companion matrix eigenvalues
+        np.random.seed(1234)
+        for i in range(200):
+            scale = np.random.uniform(0.1, 1.5)
+            polynomial = np.r_[1, np.random.normal(scale=scale, size=4)]
+            eigvals = np.linalg.eigvals(tools.companion_matrix(polynomial))
+            desired = np.all(np.abs(eigvals) < 1 - 1e-10)
+            assert_equal(tools.is_invertible(polynomial), desired)
+
+            polynomial = [1] + [np.random.normal(scale=scale / 2,
+                                                 size=(2, 2))
+                                for j in range(3)]
+            eigvals = np.linalg.eigvals(tools.companion_matrix(polynomial))
+            desired = np.all(np.abs(eigvals) < 1 - 1e-10)
+            assert_equal(tools.is_invertible(polynomial), desired)
+
+        assert_equal(tools.is_invertible([1, 0.1, 0.1, 0.1]), True)
+        assert_equal(tools.is_invertible([1, 0.1, 0.1, 1.5]), False)
+
 
 class TestConstrainStationaryUnivariate:
 
@@ -228,9 +360,11 @@ class TestStationaryUnivariate:
     # Test that the constraint and unconstrained functions are inverses
 
     constrained_cases = [
-        np.array([0]), np.array([0.1]), np.array([-0.5]), np.array([0.999])]
+        np.array([0]), np.array([0.1]), np.array([-0.5]), np.array([0.999]),
+        np.array([-0.5, 0.2]), np.array([0.3, -0.2, 0.1])]
     unconstrained_cases = [
-        np.array([10.]), np.array([-40.42]), np.array([0.123])]
+        np.array([10.]), np.array([-40.42]), np.array([0.123]),
+        np.array([1.5, -0.3, 2.1, 0.4, -1.2])]
 
     def test_cases(self):
         for constrained in self.constrained_cases:
@@ -244,6 +378,37 @@ class TestStationaryUnivariate:
             assert_allclose(reunconstrained, unconstrained)
 
 
+def test_stationary_univariate_recursion():
+    # Test the (vectorized) recursions against an elementwise implementation
+    def constrain(unconstrained):
+        n = unconstrained.shape[0]
+        y = np.zeros((n, n))
+        r = unconstrained/((1 + unconstrained**2)**0.5)
+        for k in range(n):
+            for i in range(k):
+                y[k, i] = y[k - 1, i] + r[k] * y[k - 1, k - i - 1]
+            y[k, k] = r[k]
+        return -y[n - 1, :]
+
+    def unconstrain(constrained):
+        n = constrained.shape[0]
+        y = np.zeros((n, n))
+        y[n-1:] = -constrained
+        for k in range(n-1, 0, -1):
+            for i in range(k):
+                y[k-1, i] = (y[k, i] - y[k, k]*y[k, k-i-1]) / (1 - y[k, k]**2)
+        r = y.diagonal()
+        return r / ((1 - r**2)**0.5)
+
+    np.random.seed(1234)
+    for n in [1, 2, 3, 6, 7, 10, 25]:
+        unconstrained = np.random.normal(scale=2, size=n)
+        constrained = tools.constrain_stationary_univariate(unconstrained)
+        assert_allclose(constrained, constrain(unconstrained))
+        assert_allclose(tools.unconstrain_stationary_univariate(constrained),
+                        unconstrain(constrained))
+
+
 class TestValidateMatrixShape:
     # name, shape, nrows, ncols, nobs
     valid = [
@@ -349,6 +514,12 @@ def test_multivariate_acovf():
         _acovf([Phi_1, Phi_2], Sigma_u, maxlag=3),
         [Gamma_0, Gamma_1, Gamma_2, Gamma_3], atol=1e-3)
 
+    # Stacked and horizontally concatenated coefficient matrices
+    desired = _acovf([Phi_1, Phi_2], Sigma_u, maxlag=3)
+    assert_allclose(_acovf(np.array([Phi_1, Phi_2]), Sigma_u, maxlag=3),
+                    desired)
+    assert_allclose(_acovf(np.c_[Phi_1, Phi_2], Sigma_u, maxlag=3), desired)
+
     # Test sample acovf in the univariate case against sm.tsa.acovf
     x = np.arange(20)*1.0
     assert_allclose(
@@ -366,6 +537,11 @@ def test_multivariate_pacf():
         tools._compute_multivariate_sample_pacf(np.c_[x, y], maxlag=1)[0],
         np.diag([1, 0]), atol=1e-2)
 
+    # Invalid autocovariances should raise an error
+    autocovariances = [np.eye(2), np.full((2, 2), np.nan)]
+    with pytest.raises(ValueError):
+        tools._compute_multivariate_pacf_from_autocovariances(autocovariances)
+
 
 class TestConstrainStationaryMultivariate:
 
@@ -405,6 +581,102 @@ class TestConstrainStationaryMultivariate:
             assert_array_less(np.abs(np.linalg.eigvals(companion)), 1)
 
 
+@pytest.mark.parametrize('transform_variance', [True, False])
+@pytest.mark.parametrize('use_list', [True, False])
+def test_constrain_stationary_multivariate_python(use_list,
+                                                  transform_variance):
+    # Test that the Python version matches the Cython version
+    np.random.seed(1234)
+    k_endog = 3
+    order = 3
+    unconstrained = np.random.normal(size=(k_endog, k_endog * order))
+    error_variance = np.array([[2.0, 0.5, 0.1],
+                               [0.5, 1.0, 0.2],
+                               [0.1, 0.2, 1.5]])
+    if use_list:
+        unconstrained = [unconstrained[:, i * k_endog:(i + 1) * k_endog]
+                         for i in range(order)]
+
+    desired, desired_variance = tools.constrain_stationary_multivariate(
+        unconstrained, error_variance, transform_variance)
+    actual, actual_variance = tools.constrain_stationary_multivariate_python(
+        unconstrained, error_variance, transform_variance)
+
+    assert_equal(type(actual), type(desired))
+    assert_allclose(actual, desired)
+    assert_allclose(actual_variance, desired_variance)
+
+    # A lower-precision variance should not reduce the precision of the
+    # computations
+    error_variance = error_variance.astype(np.float32)
+    desired, desired_variance = tools.constrain_stationary_multivariate_python(
+        unconstrained, error_variance.astype(np.float64), transform_variance)
+    actual, actual_variance = tools.constrain_stationary_multivariate_python(
+        unconstrained, error_variance, transform_variance)
+    assert_equal(actual_variance.dtype, np.float64)
+    assert_allclose(actual, desired, rtol=1e-12)
+    assert_allclose(actual_variance, desired_variance, rtol=1e-12)
+
+
+def test_constrain_stationary_multivariate_array_like():
+    # With an explicit prefix, the variance may be given as a nested list
+    np.random.seed(1234)
+    unconstrained = np.random.normal(size=(2, 4))
+    variance = [[1., 0.], [0., 1.]]
+    desired, desired_variance = tools.constrain_stationary_multivariate(
+        unconstrained, np.array(variance), prefix='d')
+    actual, actual_variance = tools.constrain_stationary_multivariate(
+        unconstrained, variance, prefix='d')
+    assert_allclose(actual, desired)
+    assert_allclose(actual_variance, desired_variance)
+
+
+def test_unconstrain_stationary_multivariate_univariate():
+    # The univariate case is handled separately, but should match the general
+    # algorithm
+    np.random.seed(1234)
+    for order in [1, 2, 5]:
+        constrained = tools.constrain_stationary_univariate(
+            np.random.normal(size=order))[None, :]
+        error_variance = np.array([[2.5]])
+
+        pacf = tools._compute_multivariate_pacf_from_coefficients(
+            constrained, error_variance)
+        desired = np.concatenate(
+            tools._unconstrain_sv_less_than_one(pacf), axis=1)
+
+        actual, _ = tools.unconstrain_stationary_multivariate(
+            constrained, error_variance)
+        assert_allclose(actual, desired)
+
+        actual, _ = tools.unconstrain_stationary_multivariate(
+            [constrained[:, i:i+1] for i in range(order)], error_variance)
+        assert_equal(len(actual), order)
+        assert_allclose(np.concatenate(actual, axis=1), desired)
+
+    # Non-stationary coefficients should still raise an error
+    with pytest.raises(np.linalg.LinAlgError):
+        tools.unconstrain_stationary_multivariate(np.array([[1.5]]),
+                                                  np.eye(1))
+
+
+def test_unconstrain_stationary_multivariate_dtype():
+    # Computations can be done in single precision, with the result returned
+    # in double precision
+    np.random.seed(1234)
+    unconstrained = np.random.normal(scale=0.5, size=(2, 4))
+    error_variance = np.eye(2)
+    constrained, _ = tools.constrain_stationary_multivariate(
+        unconstrained, error_variance)
+
+    desired, _ = tools.unconstrain_stationary_multivariate(
+        constrained, error_variance)
+    actual, _ = tools.unconstrain_stationary_multivariate(
+        constrained, error_variance, dtype=np.float32)
+    assert_equal(actual.dtype, np.float64)
+    assert_allclose(actual, desired, rtol=1e-4, atol=1e-5)
+
+
 class TestUnconstrainStationaryMultivariate:
 
     cases = [
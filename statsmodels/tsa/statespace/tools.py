@@ -4,13 +4,16 @@ Statespace Tools
 Author: Chad Fulton
 License: Simplified-BSD
 """
+from functools import lru_cache
+
 import numpy as np
+from scipy import linalg
 from scipy.linalg import solve_sylvester
 import pandas as pd
 
 from statsmodels.compat.pandas import Appender
 from statsmodels.tools.data import _is_using_pandas
-from scipy.linalg.blas import find_best_blas_type
+from scipy.linalg.blas import find_best_blas_type, get_blas_funcs
 from . import (_initialization, _representation, _kalman_filter,
                _kalman_smoother, _simulation_smoother,
                _cfa_simulation_smoother, _tools)
@@ -214,27 +217,40 @@ def companion_matrix(polynomial):
                 polynomial = np.asanyarray(polynomial)
             # Check if 1 was passed as the first argument (indicating an
             # identity matrix)
-            elif polynomial[0] == 1:
-                polynomial[0] = np.eye(m)
+            elif np.ndim(polynomial[0]) == 0 and polynomial[0] == 1:
+                polynomial[0] = np.eye(
+                    m, dtype=np.asanyarray(polynomial[1:]).dtype)
                 identity_matrix = True
         else:
             m = 1
             polynomial = np.asanyarray(polynomial)
 
-    matrix = np.zeros((n * m, n * m), dtype=np.asanyarray(polynomial).dtype)
-    idx = np.diag_indices((n - 1) * m)
-    idx = (idx[0], idx[1] + m)
-    matrix[idx] = 1
+    # Floating point and complex dtypes (including single precision) are
+    # preserved, while integer polynomials give a float64 companion matrix
+    if polynomial is None:
+        dtype = np.float64
+    else:
+        dtype = np.asanyarray(polynomial).dtype
+        if dtype.kind in 'biu':
+            dtype = np.float64
+
+    # Identity matrices on the (block) superdiagonal
+    matrix = np.eye(n * m, k=m, dtype=dtype)
     if polynomial is not None and n > 0:
         if m == 1:
             matrix[:, 0] = -polynomial[1:] / polynomial[0]
         elif identity_matrix:
-            for i in range(n):
-                matrix[i * m:(i + 1) * m, :m] = -polynomial[i+1].T
+            # Stack the coefficient matrices so that the first block column
+            # can be filled in a single assignment
+            coefficients = np.array(polynomial[1:])
+            matrix[:, :m] = -coefficients.transpose(0, 2, 1).reshape(n * m, m)
         else:
-            inv = np.linalg.inv(polynomial[0])
-            for i in range(n):
-                matrix[i * m:(i + 1) * m, :m] = -np.dot(inv, polynomial[i+1]).T
+            # C_0^{-1} [C_1, ..., C_n], computed with a single solve rather
+            # than by forming the inverse of C_0
+            coefficients = np.linalg.solve(
+                polynomial[0], np.concatenate(polynomial[1:], axis=1))
+            matrix[:, :m] = -coefficients.reshape(m, n, m).transpose(
+                1, 2, 0).reshape(n * m, m)
     return matrix
 
 
@@ -271,26 +287,54 @@ def diff(series, k_diff=1, k_seasonal_diff=None, seasonal_periods=1):
         The differenced array.
     """
     pandas = _is_using_pandas(series, None)
-    differenced = np.asanyarray(series) if not pandas else series
+
+    if pandas:
+        differenced = series.to_numpy()
+        # Boolean and extension (e.g. nullable integer) dtypes, including
+        # DataFrames with such columns (which give object arrays), are
+        # differenced by pandas, which determines their output dtypes
+        extension = series.ndim == 1 and not isinstance(series.dtype,
+                                                        np.dtype)
+        if extension or differenced.dtype.kind not in 'iufc':
+            differenced = series
+            if k_seasonal_diff is not None:
+                while k_seasonal_diff > 0:
+                    sdiffed = differenced.diff(seasonal_periods)
+                    differenced = sdiffed[seasonal_periods:]
+                    k_seasonal_diff -= 1
+            while k_diff > 0:
+                differenced = differenced.diff()[1:]
+                k_diff -= 1
+            return differenced
+
+        order = k_diff + (k_seasonal_diff or 0) * seasonal_periods
+        if order == 0:
+            return series
+        # Match pandas, for which differencing integers gives floats
+        if differenced.dtype.kind in 'iu':
+            differenced = differenced.astype(np.float64)
+    else:
+        differenced = np.asanyarray(series)
 
     # Seasonal differencing
     if k_seasonal_diff is not None:
         while k_seasonal_diff > 0:
-            if not pandas:
-                differenced = (differenced[seasonal_periods:] -
-                               differenced[:-seasonal_periods])
-            else:
-                sdiffed = differenced.diff(seasonal_periods)
-                differenced = sdiffed[seasonal_periods:]
+            differenced = (differenced[seasonal_periods:] -
+                           differenced[:-seasonal_periods])
             k_seasonal_diff -= 1
 
     # Simple differencing
-    if not pandas:
-        differenced = np.diff(differenced, k_diff, axis=0)
-    else:
-        while k_diff > 0:
-            differenced = differenced.diff()[1:]
-            k_diff -= 1
+    differenced = np.diff(differenced, k_diff, axis=0)
+
+    # Re-wrap the result only once, at the end
+    if pandas:
+        index = series.index[order:]
+        if differenced.ndim == 1:
+            differenced = pd.Series(differenced, index=index,
+                                    name=series.name)
+        else:
+            differenced = pd.DataFrame(differenced, index=index,
+                                       columns=series.columns)
     return differenced
 
 
@@ -440,7 +484,60 @@ def is_invertible(polynomial, threshold=1 - 1e-10):
     # Second method:
     # np.all(np.abs(np.roots(np.r_[1, params][::-1])) > 1)
     # Final method:
-    eigvals = np.linalg.eigvals(companion_matrix(polynomial))
+    # (except that for scalar polynomials of degree one or two - e.g. the
+    # common AR(1) and AR(2) cases - the roots are computed in closed form)
+    if isinstance(polynomial, (list, tuple)):
+        is_scalar = len(polynomial) > 1 and np.ndim(polynomial[1]) == 0
+    else:
+        is_scalar = not isinstance(polynomial, (int, np.integer))
+
+    if is_scalar:
+        coefficients = np.asarray(polynomial)
+        # Note: non-finite coefficients raise, as `np.linalg.eigvals` would
+        # for higher orders
+        if coefficients.ndim == 1 and len(coefficients) == 2:
+            ratio = coefficients[1] / coefficients[0]
+            if not np.isfinite(ratio):
+                raise np.linalg.LinAlgError(
+                    'Array must not contain infs or NaNs')
+            return np.abs(ratio) < threshold
+        elif coefficients.ndim == 1 and len(coefficients) == 3:
+            # Eigenvalues of the companion matrix solve
+            # x^2 + (c_1 / c_0) x + (c_2 / c_0) = 0
+            b = coefficients[1] / coefficients[0]
+            c = coefficients[2] / coefficients[0]
+            if not (np.isfinite(b) and np.isfinite(c)):
+                raise np.linalg.LinAlgError(
+                    'Array must not contain infs or NaNs')
+            sqrt_discriminant = np.sqrt(b**2 - 4 * c + 0j)
+            eigvals = np.array([(-b + sqrt_discriminant) / 2,
+                                (-b - sqrt_discriminant) / 2])
+            return np.all(np.abs(eigvals) < threshold)
+
+    matrix = companion_matrix(polynomial)
+
+    # For scalar polynomials, before computing the eigenvalues, check simple
+    # bounds on their moduli. With :math:`\phi_i` the first column of the
+    # companion matrix, any eigenvalue with :math:`|\lambda| \geq t` must
+    # satisfy :math:`1 \leq \sum_i |\phi_i| t^{-i}`, so if that sum is less
+    # than one then all eigenvalues are inside the threshold. Also, the
+    # product of the moduli of the eigenvalues is :math:`|\phi_n|`, so if that
+    # is at least :math:`t^n` then some eigenvalue is not.
+    # (For matrix polynomials these bounds rarely decide, and computing them
+    # costs more than it saves.)
+    if is_scalar and threshold > 0:
+        # Note: the moduli are few, so Python floats are faster here
+        moduli = np.abs(matrix[:, 0]).tolist()
+        n = len(moduli)
+        if sum(moduli[i] / threshold**(i + 1) for i in range(n)) < 1:
+            return True
+        if threshold**n <= moduli[-1] < np.inf:
+            return False
+
+    # Note: the transpose of a scalar companion matrix is upper Hessenberg,
+    # but SciPy does not wrap LAPACK's ?hseqr, and passing the transpose to
+    # ?geev instead was not found to be faster.
+    eigvals = np.linalg.eigvals(matrix)
     return np.all(np.abs(eigvals) < threshold)
 
 
@@ -471,6 +568,99 @@ def solve_discrete_lyapunov(a, q, complex_step=False):
         return solve_sylvester(b.transpose(), b, -c)
 
 
+def _solve_discrete_lyapunov_doubling(a, q, tol=1e-8, max_iter=20):
+    r"""
+    Solves the discrete Lyapunov equation using the doubling algorithm.
+
+    Parameters
+    ----------
+    a : ndarray
+        Square transition matrix, assumed to be stable (all eigenvalues inside
+        the unit circle).
+    q : ndarray
+        Square matrix of the same shape as `a`.
+    tol : float, optional
+        Convergence tolerance for the Frobenius norm of :math:`A^{2^j}`.
+        Default is 1e-8.
+    max_iter : int, optional
+        Maximum number of doubling iterations. Default is 20, which covers
+        eigenvalues with modulus up to about 1 - 2e-5. Closer to the unit
+        circle, the accumulated rounding error grows, and it is better to use
+        a direct solver.
+
+    Returns
+    -------
+    x : ndarray or None
+        Solution to :math:`A X A^H - X + Q = 0`, or None if the iterations did
+        not converge (e.g. if `a` is not stable, or is nearly non-stable).
+
+    Notes
+    -----
+    The solution :math:`X = \sum_{i=0}^\infty A^i Q {A^H}^i` is accumulated
+    by repeated squaring:
+
+    .. math::
+
+        X_{j+1} = X_j + A_j X_j A_j^H, \qquad A_{j+1} = A_j^2
+
+    so that after :math:`j` iterations :math:`X_j` holds the first
+    :math:`2^j` terms of the sum, and the remaining terms are bounded by
+    :math:`\| A_j \|^2 \| X_j \|`. Each iteration requires only three
+    matrix multiplications.
+    """
+    dtype = np.result_type(a, q)
+    a = np.array(a, dtype=dtype)
+    x = np.array(q, dtype=dtype)
+
+    tmp = np.empty_like(x)
+    update = np.empty_like(x)
+    squared = np.empty_like(a)
+    with np.errstate(over='ignore', invalid='ignore'):
+        for i in range(max_iter):
+            np.matmul(a, x, out=tmp)
+            np.matmul(tmp, a.conj().T, out=update)
+            x += update
+            np.matmul(a, a, out=squared)
+            a, squared = squared, a
+
+            norm = np.linalg.norm(a)
+            if norm < tol:
+                return x
+            elif not np.isfinite(norm):
+                break
+    return None
+
+
+def _solve_discrete_lyapunov_direct(a, q):
+    r"""
+    Solves the discrete Lyapunov equation using the Kronecker product form.
+
+    Parameters
+    ----------
+    a : ndarray
+        Square transition matrix.
+    q : ndarray
+        Square matrix of the same shape as `a`.
+
+    Returns
+    -------
+    x : ndarray
+        Solution to :math:`A X A^H - X + Q = 0`.
+
+    Notes
+    -----
+    Solves :math:`(I - A \otimes \bar A) vec(X) = vec(Q)`, as in the
+    "direct" method of `scipy.linalg.solve_discrete_lyapunov`, but without
+    its input validation. This requires :math:`O(n^6)` operations, and so is
+    only useful for very small systems, for which it is faster than iterative
+    methods.
+    """
+    n = a.shape[0]
+    lhs = np.kron(a, a.conj())
+    lhs = np.eye(n * n, dtype=lhs.dtype) - lhs
+    return np.linalg.solve(lhs, q.ravel()).reshape(n, n)
+
+
 def constrain_stationary_univariate(unconstrained):
     """
     Transform unconstrained parameters used by the optimizer to constrained
@@ -499,13 +689,28 @@ def constrain_stationary_univariate(unconstrained):
     """
 
     n = unconstrained.shape[0]
-    y = np.zeros((n, n), dtype=unconstrained.dtype)
     r = unconstrained/((1 + unconstrained**2)**0.5)
-    for k in range(n):
-        for i in range(k):
-            y[k, i] = y[k - 1, i] + r[k] * y[k - 1, k - i - 1]
-        y[k, k] = r[k]
-    return -y[n - 1, :]
+
+    # For low orders (as in most ARMA models), the scalar recursion has less
+    # overhead than the vectorized one below
+    if n <= 6:
+        y = np.zeros((n, n), dtype=unconstrained.dtype)
+        for k in range(n):
+            for i in range(k):
+                y[k, i] = y[k - 1, i] + r[k] * y[k - 1, k - i - 1]
+            y[k, k] = r[k]
+        return -y[n - 1, :]
+
+    # Only the previous row of the recursion is required, so it is stored in
+    # a single vector that is updated in place (the right-hand side of the
+    # update is fully evaluated before it is assigned)
+    y = np.zeros(n, dtype=unconstrained.dtype)
+    y[0] = r[0]
+    for k in range(1, n):
+        # Vectorized over i: y[k - i - 1] is the reversed row
+        y[:k] = y[:k] + r[k] * y[k - 1::-1]
+        y[k] = r[k]
+    return -y
 
 
 def unconstrain_stationary_univariate(constrained):
@@ -535,12 +740,25 @@ def unconstrain_stationary_univariate(constrained):
        Biometrika 71 (2) (August 1): 403-404.
     """
     n = constrained.shape[0]
-    y = np.zeros((n, n), dtype=constrained.dtype)
-    y[n-1:] = -constrained
-    for k in range(n-1, 0, -1):
-        for i in range(k):
-            y[k-1, i] = (y[k, i] - y[k, k]*y[k, k-i-1]) / (1 - y[k, k]**2)
-    r = y.diagonal()
+    if n <= 6:
+        # As in `constrain_stationary_univariate`, use the scalar recursion
+        # for low orders
+        y = np.zeros((n, n), dtype=constrained.dtype)
+        y[n-1:] = -constrained
+        for k in range(n-1, 0, -1):
+            for i in range(k):
+                y[k-1, i] = (y[k, i] - y[k, k]*y[k, k-i-1]) / (1 - y[k, k]**2)
+        r = y.diagonal()
+    else:
+        # As in `constrain_stationary_univariate`, the rows of the recursion
+        # are stored in a single vector. Since the update for row k - 1 only
+        # modifies the first k elements, at the end element k holds the
+        # diagonal element of row k.
+        y = np.zeros(n, dtype=constrained.dtype)
+        y[:] = -constrained
+        for k in range(n-1, 0, -1):
+            y[:k] = (y[:k] - y[k]*y[k-1::-1]) / (1 - y[k]**2)
+        r = y
     x = r / ((1 - r**2)**0.5)
     return x
 
@@ -553,9 +771,10 @@ def _constrain_sv_less_than_one_python(unconstrained, order=None,
 
     Parameters
     ----------
-    unconstrained : list
+    unconstrained : list or ndarray
         Arbitrary matrices. Should be a list of length `order`, where each
-        element is an array sized `k_endog` x `k_endog`.
+        element is an array sized `k_endog` x `k_endog`, or an array of these
+        matrices stacked along the first axis.
     order : int, optional
         The order of the autoregression.
     k_endog : int, optional
@@ -563,9 +782,9 @@ def _constrain_sv_less_than_one_python(unconstrained, order=None,
 
     Returns
     -------
-    constrained : list
-        Partial autocorrelation matrices. Should be a list of length
-        `order`, where each element is an array sized `k_endog` x `k_endog`.
+    constrained : ndarray
+        Partial autocorrelation matrices. An array sized
+        `order` x `k_endog` x `k_endog`.
 
     See Also
     --------
@@ -576,20 +795,18 @@ def _constrain_sv_less_than_one_python(unconstrained, order=None,
     Corresponds to Lemma 2.2 in Ansley and Kohn (1986). See
     `constrain_stationary_multivariate` for more details.
     """
-
-    from scipy import linalg
-
-    constrained = []  # P_s,  s = 1, ..., p
     if order is None:
         order = len(unconstrained)
     if k_endog is None:
         k_endog = unconstrained[0].shape[0]
 
-    eye = np.eye(k_endog)
-    for i in range(order):
-        A = unconstrained[i]
-        B, lower = linalg.cho_factor(eye + np.dot(A, A.T), lower=True)
-        constrained.append(linalg.solve_triangular(B, A, lower=lower))
+    # Handle all `order` matrices at once, as a stacked array
+    A = np.array(unconstrained[:order])
+    # B B' = I + A A'
+    B = np.linalg.cholesky(
+        np.eye(k_endog) + np.matmul(A, A.swapaxes(1, 2)))
+    # P = B^{-1} A
+    constrained = np.linalg.solve(B, A)  # P_s,  s = 1, ..., p
     return constrained
 
 
@@ -602,9 +819,10 @@ def _compute_coefficients_from_multivariate_pacf_python(
 
     Parameters
     ----------
-    partial_autocorrelations : list
+    partial_autocorrelations : list or ndarray
         Partial autocorrelation matrices. Should be a list of length `order`,
-        where each element is an array sized `k_endog` x `k_endog`.
+        where each element is an array sized `k_endog` x `k_endog`, or an
+        array of these matrices stacked along the first axis.
     error_variance : ndarray
         The variance / covariance matrix of the error term. Should be sized
         `k_endog` x `k_endog`. This is used as input in the algorithm even if
@@ -622,9 +840,9 @@ def _compute_coefficients_from_multivariate_pacf_python(
 
     Returns
     -------
-    coefficient_matrices : list
+    coefficient_matrices : ndarray
         Transformed coefficient matrices leading to a stationary VAR
-        representation.
+        representation. An array sized `order` x `k_endog` x `k_endog`.
 
     See Also
     --------
@@ -635,13 +853,16 @@ def _compute_coefficients_from_multivariate_pacf_python(
     Corresponds to Lemma 2.1 in Ansley and Kohn (1986). See
     `constrain_stationary_multivariate` for more details.
     """
-    from scipy import linalg
-
     if order is None:
         order = len(partial_autocorrelations)
     if k_endog is None:
         k_endog = partial_autocorrelations[0].shape[0]
 
+    # Carry out the recursions in at least the precision of the coefficients,
+    # even if the variance is given in lower precision
+    error_variance = np.asarray(error_variance, dtype=np.result_type(
+        error_variance, partial_autocorrelations[0]))
+
     # If we want to keep the provided variance but with the constrained
     # coefficient matrices, we need to make a copy here, and then after the
     # main loop we will transform the coefficients to match the passed variance
@@ -656,14 +877,29 @@ def _compute_coefficients_from_multivariate_pacf_python(
 
     forward_variances = [error_variance]   # \Sigma_s
     backward_variances = [error_variance]  # \Sigma_s^*,  s = 0, ..., p
-    autocovariances = [error_variance]     # \Gamma_s
+
+    error_variance_factor = linalg.cholesky(error_variance, lower=True)
+
     # \phi_{s,k}, s = 1, ..., p
     #             k = 1, ..., s+1
-    forwards = []
+    # These are stacked into arrays shaped `order` x `k_endog` x `k_endog`,
+    # where only the first s+1 matrices are used in iteration s. Each
+    # iteration writes into the buffers that held the results from two
+    # iterations ago, so that no arrays are allocated (or copied) in the loop.
+    dtype = np.result_type(error_variance_factor, partial_autocorrelations[0])
+    forwards = np.zeros((order, k_endog, k_endog), dtype=dtype)
+    prev_forwards = np.zeros_like(forwards)
     # \phi_{s,k}^*
-    backwards = []
+    backwards = np.zeros_like(forwards)
+    prev_backwards = np.zeros_like(forwards)
 
-    error_variance_factor = linalg.cholesky(error_variance, lower=True)
+    # For real matrices, the variance updates can be computed as symmetric
+    # rank-k updates (in the complex case, the Cholesky factors satisfy
+    # L L^H = Sigma, so that they cannot be used in the same way)
+    syrk = None
+    if not (np.iscomplexobj(partial_autocorrelations[0]) or
+            np.iscomplexobj(error_variance)):
+        syrk = get_blas_funcs('syrk', dtype=dtype)
 
     forward_factors = [error_variance_factor]
     backward_factors = [error_variance_factor]
@@ -676,10 +912,8 @@ def _compute_coefficients_from_multivariate_pacf_python(
     # [p,p], [p,1], ..., [p,p-1]
     # the last row, correctly ordered, is then used as the coefficients
     for s in range(order):  # s = 0, ..., p-1
-        prev_forwards = forwards
-        prev_backwards = backwards
-        forwards = []
-        backwards = []
+        prev_forwards, forwards = forwards, prev_forwards
+        prev_backwards, backwards = backwards, prev_backwards
 
         # Create the "last" (k = s+1) matrix
         # Note: this is for k = s+1. However, below we then have to fill
@@ -687,51 +921,64 @@ def _compute_coefficients_from_multivariate_pacf_python(
         # P L*^{-1} = x
         # x L* = P
         # L*' x' = P'
-        forwards.append(
+        forward = np.dot(
+            forward_factors[s],
             linalg.solve_triangular(
                 backward_factors[s], partial_autocorrelations[s].T,
-                lower=True, trans='T'))
-        forwards[0] = np.dot(forward_factors[s], forwards[0].T)
+                lower=True, trans='T').T)
+
+        # Create the remaining k = 1, ..., s matrices,
+        # only has an effect if s >= 1
+        # Note: prev_backwards[s-1::-1][k] = prev_backwards[s-(k+1)], so
+        # that all s matrices are computed with a single (broadcast) matmul
+        np.matmul(forward, prev_backwards[:s][::-1], out=forwards[:s])
+        np.subtract(prev_forwards[:s], forwards[:s], out=forwards[:s])
+        forwards[s] = forward
+
+        # Create forward variance
+        if syrk is not None:
+            # Symmetric rank-k updates, e.g. using Sigma* = L* L*':
+            # Sigma - phi Sigma* phi' = Sigma - (phi L*) (phi L*)'
+            # Note: only the lower triangles are computed, which are all
+            # that are referenced by the Cholesky decompositions.
+            forward_variances.append(syrk(
+                -1.0, np.dot(forward, backward_factors[s]), beta=1.0,
+                c=forward_variances[s], lower=1))
+        else:
+            forward_variances.append(
+                forward_variances[s] -
+                np.dot(np.dot(forward, backward_variances[s]), forward.T)
+            )
+
+        # In the last iteration, only the forward coefficients and variance
+        # are used, so we do not need the backward coefficients and variance
+        # or the new Cholesky factors
+        if s == order - 1:
+            break
 
         # P' L^{-1} = x
         # x L = P'
         # L' x' = P
-        backwards.append(
+        backward = np.dot(
+            backward_factors[s],
             linalg.solve_triangular(
                 forward_factors[s], partial_autocorrelations[s],
-                lower=True, trans='T'))
-        backwards[0] = np.dot(backward_factors[s], backwards[0].T)
-
-        # Update the variance
-        # Note: if s >= 1, this will be further updated in the for loop
-        # below
-        # Also, this calculation will be re-used in the forward variance
-        tmp = np.dot(forwards[0], backward_variances[s])
-        autocovariances.append(tmp.copy().T)
-
-        # Create the remaining k = 1, ..., s matrices,
-        # only has an effect if s >= 1
-        for k in range(s):
-            forwards.insert(k, prev_forwards[k] - np.dot(
-                forwards[-1], prev_backwards[s-(k+1)]))
-
-            backwards.insert(k, prev_backwards[k] - np.dot(
-                backwards[-1], prev_forwards[s-(k+1)]))
+                lower=True, trans='T').T)
 
-            autocovariances[s+1] += np.dot(autocovariances[k+1],
-                                           prev_forwards[s-(k+1)].T)
+        np.matmul(backward, prev_forwards[:s][::-1], out=backwards[:s])
+        np.subtract(prev_backwards[:s], backwards[:s], out=backwards[:s])
+        backwards[s] = backward
 
-        # Create forward and backwards variances
-        forward_variances.append(
-            forward_variances[s] - np.dot(tmp, forwards[s].T)
-        )
-        backward_variances.append(
-            backward_variances[s] -
-            np.dot(
-                np.dot(backwards[s], forward_variances[s]),
-                backwards[s].T
+        # Create backward variance
+        if syrk is not None:
+            backward_variances.append(syrk(
+                -1.0, np.dot(backward, forward_factors[s]), beta=1.0,
+                c=backward_variances[s], lower=1))
+        else:
+            backward_variances.append(
+                backward_variances[s] -
+                np.dot(np.dot(backward, forward_variances[s]), backward.T)
             )
-        )
 
         # Cholesky factors
         forward_factors.append(
@@ -744,6 +991,8 @@ def _compute_coefficients_from_multivariate_pacf_python(
     # If we do not want to use the transformed variance, we need to
     # adjust the constrained matrices, as presented in Lemma 2.3, see above
     variance = forward_variances[-1]
+    if syrk is not None:
+        variance = np.tril(variance) + np.tril(variance, -1).T
     if not transform_variance:
         # Here, we need to construct T such that:
         # variance = T * initial_variance * T'
@@ -752,16 +1001,27 @@ def _compute_coefficients_from_multivariate_pacf_python(
         # L L' = T M M' T' = (TM) (TM)'
         # => L = T M
         # => L M^{-1} = T
+        # Rather than forming the inverses explicitly, we use triangular
+        # solves:
+        # T L = M => L' T' = M'
+        # and since T^{-1} = L M^{-1}, for x = T phi T^{-1}:
+        # x M = T phi L => M' x' = (T phi L)'
         initial_variance_factor = np.linalg.cholesky(initial_variance)
         transformed_variance_factor = np.linalg.cholesky(variance)
-        transform = np.dot(initial_variance_factor,
-                           np.linalg.inv(transformed_variance_factor))
-        inv_transform = np.linalg.inv(transform)
-
-        for i in range(order):
-            forwards[i] = (
-                np.dot(np.dot(transform, forwards[i]), inv_transform)
-            )
+        transform = linalg.solve_triangular(
+            transformed_variance_factor, initial_variance_factor.T,
+            lower=True, trans='T').T
+
+        # All `order` matrices are adjusted at once: the products are
+        # broadcast over the stacked matrices, and the triangular systems
+        # share the same matrix, so their right-hand sides are solved
+        # together, stacked horizontally as [tmp_1', ..., tmp_p']
+        tmp = np.matmul(np.matmul(transform, forwards),
+                        transformed_variance_factor)
+        tmp = tmp.transpose(2, 0, 1).reshape(k_endog, order * k_endog)
+        tmp = linalg.solve_triangular(
+            initial_variance_factor, tmp, lower=True, trans='T')
+        forwards = tmp.reshape(k_endog, order, k_endog).transpose(1, 2, 0)
 
     return forwards, variance
 
@@ -837,17 +1097,17 @@ def constrain_stationary_multivariate_python(unconstrained, error_variance,
     """
 
     use_list = type(unconstrained) == list
+    # Stack the matrices into an `order` x `k_endog` x `k_endog` array
     if not use_list:
         k_endog, order = unconstrained.shape
         order //= k_endog
 
-        unconstrained = [
-            unconstrained[:k_endog, i*k_endog:(i+1)*k_endog]
-            for i in range(order)
-        ]
-
-    order = len(unconstrained)
-    k_endog = unconstrained[0].shape[0]
+        unconstrained = unconstrained.reshape(
+            k_endog, order, k_endog).transpose(1, 0, 2)
+    else:
+        order = len(unconstrained)
+        k_endog = unconstrained[0].shape[0]
+        unconstrained = np.array(unconstrained)
 
     # Step 1: convert from arbitrary matrices to those with singular values
     # less than one.
@@ -860,13 +1120,49 @@ def constrain_stationary_multivariate_python(unconstrained, error_variance,
     constrained, var = _compute_coefficients_from_multivariate_pacf_python(
         sv_constrained, error_variance, transform_variance, order, k_endog)
 
-    if not use_list:
-        constrained = np.concatenate(constrained, axis=1).reshape(
+    if use_list:
+        constrained = list(constrained)
+    else:
+        constrained = constrained.transpose(1, 0, 2).reshape(
             k_endog, k_endog * order)
 
     return constrained, var
 
 
+@lru_cache(maxsize=None)
+def _get_constrain_multivariate_funcs(prefix=None, dtype_chars=None):
+    """
+    Get the dtype and Cython routines used to constrain a VAR
+
+    Parameters
+    ----------
+    prefix : {'s','d','c','z'}, optional
+        The BLAS prefix. If not given, it is determined from `dtype_chars`.
+    dtype_chars : tuple of str, optional
+        The dtype characters of the unconstrained matrices and the variance.
+
+    Returns
+    -------
+    dtype : type
+        The dtype corresponding to the prefix.
+    constrain_sv : callable
+        The appropriate `_?constrain_sv_less_than_one` routine.
+    compute_coefficients : callable
+        The appropriate `_?compute_coefficients_from_multivariate_pacf`
+        routine.
+
+    Notes
+    -----
+    This is cached, so that repeated calls with the same dtypes (e.g. within
+    an optimizer loop) do not need to resolve the BLAS type each time.
+    """
+    if prefix is None:
+        prefix, _, _ = find_best_blas_type(
+            [np.empty(0, dtype=char) for char in dtype_chars])
+    return (prefix_dtype_map[prefix], prefix_sv_map[prefix],
+            prefix_pacf_map[prefix])
+
+
 @Appender(constrain_stationary_multivariate_python.__doc__)
 def constrain_stationary_multivariate(unconstrained, variance,
                                       transform_variance=False,
@@ -885,10 +1181,15 @@ def constrain_stationary_multivariate(unconstrained, variance,
         raise ValueError('Must have at least 1 endogenous variable')
 
     if prefix is None:
-        prefix, dtype, _ = find_best_blas_type(
-            [unconstrained, variance])
-    dtype = prefix_dtype_map[prefix]
+        dtype, constrain_sv, compute_coefficients = (
+            _get_constrain_multivariate_funcs(
+                dtype_chars=(unconstrained.dtype.char, variance.dtype.char)))
+    else:
+        dtype, constrain_sv, compute_coefficients = (
+            _get_constrain_multivariate_funcs(prefix))
 
+    # The Cython routines require Fortran-ordered arrays of the resolved
+    # dtype (inputs already in that form are not copied)
     unconstrained = np.asfortranarray(unconstrained, dtype=dtype)
     variance = np.asfortranarray(variance, dtype=dtype)
 
@@ -896,16 +1197,18 @@ def constrain_stationary_multivariate(unconstrained, variance,
     # less than one.
     # sv_constrained = _constrain_sv_less_than_one(unconstrained, order,
     #                                              k_endog, prefix)
-    sv_constrained = prefix_sv_map[prefix](unconstrained, order, k_endog)
+    sv_constrained = constrain_sv(unconstrained, order, k_endog)
 
     # Step 2: convert matrices from our "partial autocorrelation matrix"
     # space (matrices with singular values less than one) to the space of
     # stationary coefficient matrices
-    constrained, variance = prefix_pacf_map[prefix](
+    constrained, variance = compute_coefficients(
         sv_constrained, variance, transform_variance, order, k_endog)
 
-    constrained = np.array(constrained, dtype=dtype)
-    variance = np.array(variance, dtype=dtype)
+    # The Cython routines return newly allocated memoryviews, so these can be
+    # wrapped as arrays without copying
+    constrained = np.asarray(constrained, dtype=dtype)
+    variance = np.asarray(variance, dtype=dtype)
 
     if use_list:
         constrained = [
@@ -923,9 +1226,10 @@ def _unconstrain_sv_less_than_one(constrained, order=None, k_endog=None):
 
     Parameters
     ----------
-    constrained : list
+    constrained : list or ndarray
         The partial autocorrelation matrices. Should be a list of length
-        `order`, where each element is an array sized `k_endog` x `k_endog`.
+        `order`, where each element is an array sized `k_endog` x `k_endog`,
+        or an array of these matrices stacked along the first axis.
     order : int, optional
         The order of the autoregression.
     k_endog : int, optional
@@ -933,9 +1237,8 @@ def _unconstrain_sv_less_than_one(constrained, order=None, k_endog=None):
 
     Returns
     -------
-    unconstrained : list
-        Unconstrained matrices. A list of length `order`, where each element is
-        an array sized `k_endog` x `k_endog`.
+    unconstrained : ndarray
+        Unconstrained matrices. An array sized `order` x `k_endog` x `k_endog`.
 
     See Also
     --------
@@ -946,22 +1249,19 @@ def _unconstrain_sv_less_than_one(constrained, order=None, k_endog=None):
     Corresponds to the inverse of Lemma 2.2 in Ansley and Kohn (1986). See
     `unconstrain_stationary_multivariate` for more details.
     """
-    from scipy import linalg
-
-    unconstrained = []  # A_s,  s = 1, ..., p
     if order is None:
         order = len(constrained)
     if k_endog is None:
         k_endog = constrained[0].shape[0]
 
-    eye = np.eye(k_endog)
-    for i in range(order):
-        P = constrained[i]
-        # B^{-1} B^{-1}' = I - P P'
-        B_inv, lower = linalg.cho_factor(eye - np.dot(P, P.T), lower=True)
-        # A = BP
-        # B^{-1} A = P
-        unconstrained.append(linalg.solve_triangular(B_inv, P, lower=lower))
+    # Handle all `order` matrices at once, as a stacked array
+    P = np.array(constrained[:order])
+    # B^{-1} B^{-1}' = I - P P'
+    B_inv = np.linalg.cholesky(
+        np.eye(k_endog, dtype=P.dtype) - np.matmul(P, P.swapaxes(1, 2)))
+    # A = BP
+    # B^{-1} A = P
+    unconstrained = np.linalg.solve(B_inv, P)  # A_s,  s = 1, ..., p
     return unconstrained
 
 
@@ -1033,7 +1333,8 @@ def _compute_multivariate_acovf_from_coefficients(
         The coefficients matrices. If a list, should be a list of length
         `order`, where each element is an array sized `k_endog` x `k_endog`. If
         an array, should be the coefficient matrices horizontally concatenated
-        and sized `k_endog` x `k_endog * order`.
+        and sized `k_endog` x `k_endog * order`, or else stacked along the
+        first axis and sized `order` x `k_endog` x `k_endog`.
     error_variance : ndarray
         The variance / covariance matrix of the error term. Should be sized
         `k_endog` x `k_endog`.
@@ -1074,21 +1375,19 @@ def _compute_multivariate_acovf_from_coefficients(
     Autocovariances are calculated by solving the associated discrete Lyapunov
     equation of the state space representation of the VAR process.
     """
-    from scipy import linalg
-
-    # Convert coefficients to a list of matrices, for use in
-    # `companion_matrix`; get dimensions
+    # Convert coefficients to an `order` x `k_endog` x `k_endog` array; get
+    # dimensions
     if type(coefficients) == list:
         order = len(coefficients)
         k_endog = coefficients[0].shape[0]
+        coefficients = np.array(coefficients)
+    elif coefficients.ndim == 3:
+        order, k_endog = coefficients.shape[:2]
     else:
         k_endog, order = coefficients.shape
         order //= k_endog
-
-        coefficients = [
-            coefficients[:k_endog, i*k_endog:(i+1)*k_endog]
-            for i in range(order)
-        ]
+        coefficients = coefficients.reshape(
+            k_endog, order, k_endog).transpose(1, 0, 2)
 
     if maxlag is None:
         maxlag = order-1
@@ -1096,16 +1395,39 @@ def _compute_multivariate_acovf_from_coefficients(
     # Start with VAR(p): w_{t+1} = phi_1 w_t + ... + phi_p w_{t-p+1} + u_{t+1}
     # Then stack the VAR(p) into a VAR(1) in companion matrix form:
     # z_{t+1} = F z_t + v_t
-    companion = companion_matrix(
-        [1] + [-np.squeeze(coefficients[i]) for i in range(order)]
-    ).T
+    # where F has the coefficient matrices in its first (block) row and
+    # identity matrices on its first (block) subdiagonal. This is the
+    # transpose of `companion_matrix([1] + [-phi_1, ..., -phi_p])`, but it is
+    # constructed directly here.
+    dtype = np.result_type(coefficients, np.float64)
+    companion = np.eye(k_endog * order, k=-k_endog, dtype=dtype)
+    companion[:k_endog] = coefficients.transpose(1, 0, 2).reshape(
+        k_endog, k_endog * order)
 
     # Compute the error variance matrix for the stacked form: E v_t v_t'
     selected_variance = np.zeros(companion.shape)
     selected_variance[:k_endog, :k_endog] = error_variance
 
     # Compute the unconditional variance of z_t: E z_t z_t'
-    stacked_cov = linalg.solve_discrete_lyapunov(companion, selected_variance)
+    # Note: for very small systems (e.g. VAR(2) with 3 variables), the
+    # O((k_endog * order)^6) Kronecker-product solve is fastest. Otherwise,
+    # the doubling algorithm requires only a few matrix multiplications; it
+    # is not used for non-stationary or nearly non-stationary coefficients,
+    # in which case we fall back to SciPy
+    n = companion.shape[0]
+    if n <= 6:
+        stacked_cov = _solve_discrete_lyapunov_direct(companion,
+                                                      selected_variance)
+    else:
+        stacked_cov = _solve_discrete_lyapunov_doubling(companion,
+                                                        selected_variance)
+    if stacked_cov is None:
+        # Choose the method explicitly: the Kronecker-product ("direct")
+        # solve is accurate near the unit circle and is cheap enough for
+        # small systems, while the O(n^3) bilinear method is used otherwise
+        method = 'direct' if n <= 20 else 'bilinear'
+        stacked_cov = linalg.solve_discrete_lyapunov(
+            companion, selected_variance, method=method)
 
     # The first (block) row of the variance of z_t gives the first p-1
     # autocovariances of w_t: \Gamma_i = E w_t w_t+i with \Gamma_0 = Var(w_t)
@@ -1115,11 +1437,17 @@ def _compute_multivariate_acovf_from_coefficients(
         for i in range(min(order, maxlag+1))
     ]
 
-    for i in range(maxlag - (order-1)):
-        stacked_cov = np.dot(companion, stacked_cov)
-        autocovariances += [
-            stacked_cov[:k_endog, -k_endog:]
-        ]
+    # The remaining autocovariances follow from the Yule-Walker recursion
+    # \Gamma_h = A_1 \Gamma_{h-1} + ... + A_p \Gamma_{h-p}, which is the
+    # last (block) column of the first (block) row of F^{h-p+1} E z_t z_t'.
+    # Only that block is needed, so rather than multiplying by the full
+    # companion matrix, apply just its first (block) row.
+    if maxlag >= order:
+        for h in range(order, maxlag + 1):
+            # Lagged autocovariances, ordered \Gamma_{h-1}, ..., \Gamma_{h-p}
+            lagged = np.array(autocovariances[h - order:h][::-1])
+            autocovariances.append(
+                np.einsum('iab,ibc->ac', coefficients, lagged))
 
     if forward_autocovariances:
         for i in range(len(autocovariances)):
@@ -1152,8 +1480,36 @@ def _compute_multivariate_sample_pacf(endog, maxlag):
         sample_autocovariances)
 
 
+def _cholesky_lower(potrf, a):
+    """
+    Lower Cholesky factor from LAPACK's ?potrf, as in `scipy.linalg.cholesky`
+
+    Parameters
+    ----------
+    potrf : callable
+        The LAPACK ?potrf routine for the dtype of `a`.
+    a : ndarray
+        The (symmetric / Hermitian positive definite) matrix to factor. Only
+        the lower triangle is used, and it is not overwritten.
+
+    Returns
+    -------
+    factor : ndarray
+        The lower triangular Cholesky factor.
+    """
+    factor, info = potrf(a, lower=True, clean=True)
+    if info > 0:
+        raise np.linalg.LinAlgError(
+            '%d-th leading minor not positive definite' % info)
+    elif info < 0:
+        raise ValueError('illegal value in %d-th argument of internal potrf'
+                         % -info)
+    return factor
+
+
 def _compute_multivariate_pacf_from_autocovariances(autocovariances,
-                                                    order=None, k_endog=None):
+                                                    order=None, k_endog=None,
+                                                    dtype=None):
     """
     Compute multivariate partial autocorrelations from autocovariances.
 
@@ -1166,6 +1522,9 @@ def _compute_multivariate_pacf_from_autocovariances(autocovariances,
         The order of the autoregression.
     k_endog : int, optional
         The dimension of the data vector.
+    dtype : dtype, optional
+        The dtype in which to perform the computations. Default is the dtype
+        of the autocovariances, promoted to at least double precision.
 
     Returns
     -------
@@ -1186,13 +1545,22 @@ def _compute_multivariate_pacf_from_autocovariances(autocovariances,
     Computes sample partial autocorrelations if sample autocovariances are
     given.
     """
-    from scipy import linalg
-
     if order is None:
         order = len(autocovariances)-1
     if k_endog is None:
         k_endog = autocovariances[0].shape[0]
 
+    # Stack the autocovariances (and their transposes) into contiguous
+    # arrays, so that (lagged) blocks can be used without further copies
+    autocovariances = np.array(autocovariances[:order + 1], dtype=dtype)
+    autocovariances_T = np.ascontiguousarray(
+        autocovariances.transpose(0, 2, 1))
+
+    # Check for invalid values once up front, rather than in each of the
+    # (many, small) linear algebra calls below
+    if not np.isfinite(autocovariances).all():
+        raise ValueError('array must not contain infs or NaNs')
+
     # Now apply the Ansley and Kohn (1986) algorithm, except that instead of
     # calculating phi_{s+1, s+1} = L_s P_{s+1} {L_s^*}^{-1} (which requires
     # the partial autocorrelation P_{s+1} which is what we're trying to
@@ -1202,17 +1570,36 @@ def _compute_multivariate_pacf_from_autocovariances(autocovariances,
     # phi_{s+1, s+1} = [ \Gamma_{s+1}' - \phi_{s,1} \Gamma_s' - ... -
     #                    \phi_{s,s} \Gamma_1' ] {\Sigma_s^*}^{-1}
 
-    # Forward and backward variances
-    forward_variances = []   # \Sigma_s
-    backward_variances = []  # \Sigma_s^*,  s = 0, ..., p
+    if dtype is None:
+        dtype = np.result_type(autocovariances, np.float64)
+
+    # Call LAPACK directly, since for small matrices the argument handling in
+    # the `scipy.linalg` wrappers can cost more than the computations
+    potrf, potrs, trtrs = linalg.get_lapack_funcs(
+        ('potrf', 'potrs', 'trtrs'), dtype=dtype)
+
+    # Forward and backward variances \Sigma_s, \Sigma_s^*,  s = 0, ..., p
+    # These are updated in place, so they are not views of the input
+    forward_variance = autocovariances[0].astype(dtype)
+    backward_variance = autocovariances_T[0].astype(dtype)
+
     # \phi_{s,k}, s = 1, ..., p
     #             k = 1, ..., s+1
-    forwards = []
+    # These are stacked into arrays shaped `order` x `k_endog` x `k_endog`,
+    # where only the first s+1 matrices are used in iteration s. Each
+    # iteration writes into the buffers that held the results from two
+    # iterations ago, so that no arrays are allocated (or copied) in the loop.
+    forwards = np.zeros((order, k_endog, k_endog), dtype=dtype)
+    prev_forwards = np.zeros_like(forwards)
     # \phi_{s,k}^*
-    backwards = []
+    backwards = np.zeros_like(forwards)
+    prev_backwards = np.zeros_like(forwards)
 
-    forward_factors = []   # L_s
-    backward_factors = []  # L_s^*,  s = 0, ..., p
+    # Scratch space, reused across iterations
+    tmp = np.empty((k_endog, k_endog), dtype=dtype)
+    tmp_sum = np.empty((k_endog, k_endog), dtype=dtype)
+    forward_update = np.empty((k_endog, k_endog), dtype=dtype)
+    backward_update = np.empty((k_endog, k_endog), dtype=dtype)
 
     # Ultimately we want to construct the partial autocorrelation matrices
     # Note that this is "1-indexed" in the sense that it stores P_1, ... P_p
@@ -1228,52 +1615,49 @@ def _compute_multivariate_pacf_from_autocovariances(autocovariances,
     # the last row, correctly ordered, should be the same as the coefficient
     # matrices provided in the argument `constrained`
     for s in range(order):  # s = 0, ..., p-1
-        prev_forwards = list(forwards)
-        prev_backwards = list(backwards)
-        forwards = []
-        backwards = []
+        prev_forwards, forwards = forwards, prev_forwards
+        prev_backwards, backwards = backwards, prev_backwards
 
-        # Create forward and backwards variances Sigma_s, Sigma*_s
-        forward_variance = autocovariances[0].copy()
-        backward_variance = autocovariances[0].T.copy()
-
-        for k in range(s):
-            forward_variance -= np.dot(prev_forwards[k],
-                                       autocovariances[k+1])
-            backward_variance -= np.dot(prev_backwards[k],
-                                        autocovariances[k+1].T)
-
-        forward_variances.append(forward_variance)
-        backward_variances.append(backward_variance)
-
-        # Cholesky factors
-        forward_factors.append(
-            linalg.cholesky(forward_variances[s], lower=True)
-        )
-        backward_factors.append(
-            linalg.cholesky(backward_variances[s], lower=True)
-        )
+        # Create forward and backwards variances Sigma_s, Sigma*_s, and their
+        # Cholesky factors L_s, L_s^*
+        if s == 0:
+            # Sigma_0 = Sigma*_0 = \Gamma_0, which is symmetric, so that only
+            # a single Cholesky factorization is required
+            forward_factor = _cholesky_lower(potrf, forward_variance)
+            backward_factor = forward_factor
+        else:
+            # Rather than computing
+            # Sigma_s = \Gamma_0 - \phi_{s,1} \Gamma_1 - ...
+            #           - \phi_{s,s} \Gamma_s
+            # from scratch, use the recursions
+            # Sigma_s = Sigma_{s-1} - \phi_{s,s} Sigma*_{s-1} \phi_{s,s}'
+            # Sigma*_s = Sigma*_{s-1} - \phi*_{s,s} Sigma_{s-1} \phi*_{s,s}'
+            # which only require the last of the previous coefficients
+            np.matmul(prev_forwards[s-1], backward_variance, out=tmp)
+            np.matmul(tmp, prev_forwards[s-1].T, out=forward_update)
+            np.matmul(prev_backwards[s-1], forward_variance, out=tmp)
+            np.matmul(tmp, prev_backwards[s-1].T, out=backward_update)
+            forward_variance -= forward_update
+            backward_variance -= backward_update
+
+            forward_factor = _cholesky_lower(potrf, forward_variance)
+            backward_factor = _cholesky_lower(potrf, backward_variance)
 
         # Create the intermediate sum term
         if s == 0:
             # phi_11 = \Gamma_1' \Gamma_0^{-1}
             # phi_11 \Gamma_0 = \Gamma_1'
             # \Gamma_0 phi_11' = \Gamma_1
-            forwards.append(linalg.cho_solve(
-                (forward_factors[0], True), autocovariances[1]).T)
-            # backwards.append(forwards[-1])
-            # phi_11_star = \Gamma_1 \Gamma_0^{-1}
-            # phi_11_star \Gamma_0 = \Gamma_1
-            # \Gamma_0 phi_11_star' = \Gamma_1'
-            backwards.append(linalg.cho_solve(
-                (backward_factors[0], True), autocovariances[1].T).T)
+            forward = potrs(forward_factor, autocovariances[1],
+                            lower=True)[0].T
         else:
             # G := \Gamma_{s+1}' -
             #      \phi_{s,1} \Gamma_s' - .. - \phi_{s,s} \Gamma_1'
-            tmp_sum = autocovariances[s+1].T.copy()
-
-            for k in range(s):
-                tmp_sum -= np.dot(prev_forwards[k], autocovariances[s-k].T)
+            # Note: the sum is computed as a single contraction over k, with
+            # the lagged autocovariances ordered \Gamma_s', ..., \Gamma_1'
+            np.einsum('kab,kbc->ac', prev_forwards[:s],
+                      autocovariances_T[s:0:-1], out=tmp_sum)
+            np.subtract(autocovariances_T[s+1], tmp_sum, out=tmp_sum)
 
             # Create the "last" (k = s+1) matrix
             # Note: this is for k = s+1. However, below we then have to
@@ -1283,37 +1667,52 @@ def _compute_multivariate_pacf_from_autocovariances(autocovariances,
             # Sigma*' phi' = G'
             # Sigma* phi' = G'
             # (because Sigma* is symmetric)
-            forwards.append(linalg.cho_solve(
-                (backward_factors[s], True), tmp_sum.T).T)
+            forward = potrs(backward_factor, tmp_sum.T, lower=True)[0].T
+
+        # Partial autocorrelation matrix: P_{s+1}
+        # P = L^{-1} phi L*
+        # L P = (phi L*)
+        partial_autocorrelations.append(trtrs(
+            forward_factor, np.dot(forward, backward_factor),
+            lower=True)[0])
+
+        # In the last iteration, only the partial autocorrelation matrix is
+        # used, so we do not need the remaining coefficient matrices
+        if s == order - 1:
+            break
 
+        if s == 0:
+            # phi_11_star = \Gamma_1 \Gamma_0^{-1}
+            # phi_11_star \Gamma_0 = \Gamma_1
+            # \Gamma_0 phi_11_star' = \Gamma_1'
+            backward = potrs(backward_factor, autocovariances_T[1],
+                             lower=True)[0].T
+        else:
             # phi = G' Sigma^{-1}
             # phi Sigma = G'
             # Sigma' phi' = G
             # Sigma phi' = G
             # (because Sigma is symmetric)
-            backwards.append(linalg.cho_solve(
-                (forward_factors[s], True), tmp_sum).T)
+            backward = potrs(forward_factor, tmp_sum, lower=True)[0].T
 
         # Create the remaining k = 1, ..., s matrices,
         # only has an effect if s >= 1
-        for k in range(s):
-            forwards.insert(k, prev_forwards[k] - np.dot(
-                forwards[-1], prev_backwards[s-(k+1)]))
-            backwards.insert(k, prev_backwards[k] - np.dot(
-                backwards[-1], prev_forwards[s-(k+1)]))
+        # Note: prev_backwards[s-1::-1][k] = prev_backwards[s-(k+1)], so
+        # that all s matrices are computed with a single (broadcast) matmul
+        np.matmul(forward, prev_backwards[:s][::-1], out=forwards[:s])
+        np.subtract(prev_forwards[:s], forwards[:s], out=forwards[:s])
+        forwards[s] = forward
 
-        # Partial autocorrelation matrix: P_{s+1}
-        # P = L^{-1} phi L*
-        # L P = (phi L*)
-        partial_autocorrelations.append(linalg.solve_triangular(
-            forward_factors[s], np.dot(forwards[s], backward_factors[s]),
-            lower=True))
+        np.matmul(backward, prev_forwards[:s][::-1], out=backwards[:s])
+        np.subtract(prev_backwards[:s], backwards[:s], out=backwards[:s])
+        backwards[s] = backward
 
     return partial_autocorrelations
 
 
 def _compute_multivariate_pacf_from_coefficients(constrained, error_variance,
-                                                 order=None, k_endog=None):
+                                                 order=None, k_endog=None,
+                                                 dtype=None):
     r"""
     Transform matrices corresponding to a stationary (or invertible) process
     to matrices with singular values less than one.
@@ -1324,7 +1723,8 @@ def _compute_multivariate_pacf_from_coefficients(constrained, error_variance,
         The coefficients matrices. If a list, should be a list of length
         `order`, where each element is an array sized `k_endog` x `k_endog`. If
         an array, should be the coefficient matrices horizontally concatenated
-        and sized `k_endog` x `k_endog * order`.
+        and sized `k_endog` x `k_endog * order`, or else stacked along the
+        first axis and sized `order` x `k_endog` x `k_endog`.
     error_variance : ndarray
         The variance / covariance matrix of the error term. Should be sized
         `k_endog` x `k_endog`.
@@ -1332,6 +1732,10 @@ def _compute_multivariate_pacf_from_coefficients(constrained, error_variance,
         The order of the autoregression.
     k_endog : int, optional
         The dimension of the data vector.
+    dtype : dtype, optional
+        The dtype in which to compute the partial autocorrelations from the
+        autocovariances (which are always computed in at least double
+        precision). Default is the dtype of the autocovariances.
 
     Returns
     -------
@@ -1360,6 +1764,8 @@ def _compute_multivariate_pacf_from_coefficients(constrained, error_variance,
     if type(constrained) == list:
         order = len(constrained)
         k_endog = constrained[0].shape[0]
+    elif constrained.ndim == 3:
+        order, k_endog = constrained.shape[:2]
     else:
         k_endog, order = constrained.shape
         order //= k_endog
@@ -1373,10 +1779,12 @@ def _compute_multivariate_pacf_from_coefficients(constrained, error_variance,
         autocovariance.T for autocovariance in
         _acovf(constrained, error_variance, maxlag=order)]
 
-    return _compute_multivariate_pacf_from_autocovariances(autocovariances)
+    return _compute_multivariate_pacf_from_autocovariances(autocovariances,
+                                                           dtype=dtype)
 
 
-def unconstrain_stationary_multivariate(constrained, error_variance):
+def unconstrain_stationary_multivariate(constrained, error_variance,
+                                        dtype=None):
     """
     Transform constrained parameters used in likelihood evaluation
     to unconstrained parameters used by the optimizer
@@ -1394,6 +1802,11 @@ def unconstrain_stationary_multivariate(constrained, error_variance):
         The variance / covariance matrix of the error term. Should be sized
         `k_endog` x `k_endog`. This is used as input in the algorithm even if
         is not transformed by it (when `transform_variance` is False).
+    dtype : dtype, optional
+        The dtype in which to perform the partial autocorrelation and
+        factorization steps, for example `np.float32`. The result is returned
+        in the dtype it would otherwise have. Default is to use that dtype
+        throughout. See Notes.
 
     Returns
     -------
@@ -1405,7 +1818,14 @@ def unconstrain_stationary_multivariate(constrained, error_variance):
 
     Notes
     -----
-    Uses the list representation internally, even if an array is passed.
+    Uses a stacked (`order` x `k_endog` x `k_endog`) array representation
+    internally, even if a list is passed.
+
+    Single precision (`dtype=np.float32`) should only be used when reduced
+    accuracy is acceptable, for example to compute starting parameters for an
+    optimizer. Even so, the error grows quickly as the coefficients approach
+    the boundary of the stationary region. The autocovariances are always
+    computed in at least double precision.
 
     References
     ----------
@@ -1414,32 +1834,57 @@ def unconstrain_stationary_multivariate(constrained, error_variance):
        to Enforce Stationarity."
        Journal of Statistical Computation and Simulation 24 (2): 99-106.
     """
+    # Stack the coefficient matrices into an `order` x `k_endog` x `k_endog`
+    # array
     use_list = type(constrained) == list
     if not use_list:
         k_endog, order = constrained.shape
         order //= k_endog
 
-        constrained = [
-            constrained[:k_endog, i*k_endog:(i+1)*k_endog]
-            for i in range(order)
-        ]
+        constrained = np.ascontiguousarray(
+            constrained.reshape(k_endog, order, k_endog).transpose(1, 0, 2))
     else:
         order = len(constrained)
         k_endog = constrained[0].shape[0]
+        constrained = np.array(constrained)
+
+    # In the univariate case, the transformation does not depend on the error
+    # variance, and it is the same as `unconstrain_stationary_univariate`, up
+    # to the sign convention for the unconstrained parameters
+    if k_endog == 1:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            unconstrained = -unconstrain_stationary_univariate(
+                constrained[:, 0, 0])
+        # Non-stationary coefficients give invalid values; in that case we
+        # fall through to the general algorithm, which raises an error
+        if np.all(np.isfinite(unconstrained)):
+            unconstrained = unconstrained[:, None, None]
+            if use_list:
+                unconstrained = list(unconstrained)
+            else:
+                unconstrained = unconstrained.transpose(1, 0, 2).reshape(
+                    k_endog, order * k_endog)
+            return unconstrained, error_variance
 
     # Step 1: convert matrices from the space of stationary
     # coefficient matrices to our "partial autocorrelation matrix" space
     # (matrices with singular values less than one)
     partial_autocorrelations = _compute_multivariate_pacf_from_coefficients(
-        constrained, error_variance, order, k_endog)
+        constrained, error_variance, order, k_endog, dtype=dtype)
 
     # Step 2: convert from arbitrary matrices to those with singular values
     # less than one.
     unconstrained = _unconstrain_sv_less_than_one(
         partial_autocorrelations, order, k_endog)
+    if dtype is not None:
+        unconstrained = unconstrained.astype(
+            np.result_type(constrained, error_variance, np.float64))
 
-    if not use_list:
-        unconstrained = np.concatenate(unconstrained, axis=1)
+    if use_list:
+        unconstrained = list(unconstrained)
+    else:
+        unconstrained = unconstrained.transpose(1, 0, 2).reshape(
+            k_endog, order * k_endog)
 
     return unconstrained, error_variance
 